@@ -5,30 +5,180 @@ Created by AvaBlix
 Educational Purpose Only
 """
 
+import io
+import logging
 import os
 import json
+import hashlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3Error
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 import datetime
 import re
+import shutil
 import time
 import random
-from typing import Dict, List, Optional
-import argparse
-import sys
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+import cmd
+
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps(obj) -> bytes:
+        # Same contract as orjson.dumps: compact, UTF-8 bytes
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+logger = logging.getLogger('instaosint')
+
+# Compiled once at import, reused for every profile and caption
+_TAG_RE = re.compile(r'(#\w+)|(@\w+)')
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+
+# (profile key, user node key) pairs copied as-is by extract_profile_info
+_PROFILE_FIELDS = (
+    ('username', 'username'),
+    ('full_name', 'full_name'),
+    ('biography', 'biography'),
+    ('is_private', 'is_private'),
+    ('is_verified', 'is_verified'),
+    ('profile_pic_url', 'profile_pic_url_hd'),
+    ('external_url', 'external_url'),
+    ('is_business', 'is_business_account'),
+    ('category', 'category_name'),
+)
+
+# (profile key, user node edge) pairs whose count is read, defaulting to 0
+_COUNT_FIELDS = (
+    ('followers', 'edge_followed_by'),
+    ('following', 'edge_follow'),
+    ('posts_count', 'edge_owner_to_timeline_media'),
+)
+
+_SHAREDDATA_MARKER = b'window._sharedData'
+_CONFIG_MARKER = b'{"config":'
+
+_CDN_HOSTS = ('cdninstagram.com', 'fbcdn.net')
+
+# Token bucket (capacity, tokens per second) given to each non-CDN host
+_RATE_LIMIT = (3, 0.5)
+
+_API_URL = 'https://i.instagram.com/api/v1'
+
+# Identifies the caller as Instagram's web client, the API rejects requests without it
+_APP_HEADERS = MappingProxyType({'X-IG-App-ID': '936619743392459'})
+
+# One is picked per session, never per request: Instagram expects a client's
+# User-Agent to stay consistent for as long as its cookies do
+_USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:125.0) Gecko/20100101 Firefox/125.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.4 Safari/605.1.15',
+)
+
+_DEFAULT_HEADERS = MappingProxyType({
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    # urllib3's own list: adds br (and zstd) only when a decoder is installed
+    'Accept-Encoding': ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+})
+
+def _slice_shared_data(page: bytes, marker: bytes = _SHAREDDATA_MARKER) -> Optional[bytes]:
+    """Cut the _sharedData JSON out of a profile page with linear scans."""
+    start = page.find(marker)
+    if start == -1:
+        return None
+    start = page.find(b'{', start)
+    end = page.find(b'</script>', start)
+    if start == -1 or end == -1:
+        return None
+    return page[start:end].rstrip().rstrip(b';')
+
+def _dig(data, *keys, default=None):
+    # Nested lookup that returns default on any missing level, without
+    # allocating a throwaway {} per level like chained .get(key, {}) calls
+    for key in keys:
+        try:
+            data = data[key]
+        except (KeyError, IndexError, TypeError):
+            return default
+        if data is None:
+            return default
+    return data
+
+def _retry_after(response: requests.Response, default: float) -> float:
+    # Seconds form only; a missing header, an HTTP-date or a negative value
+    # falls back to default
+    value = response.headers.get('Retry-After')
+    if value is None:
+        return default
+    try:
+        seconds = int(value)
+    except ValueError:
+        return default
+    return min(60, seconds) if seconds >= 0 else default
+
+class TokenBucket:
+    """Thread-safe token bucket: bursts up to capacity, refills at rate tokens/second."""
+    __slots__ = ('capacity', 'rate', 'tokens', 'last', '_lock')
+    
+    def __init__(self, capacity: float, rate: float):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = float(capacity)
+        self.last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        # Take a token under the lock, possibly going into debt, then sleep the
+        # debt off outside it so concurrent callers queue up in order
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
 
 class InstagramOSINT:
-    def __init__(self):
+    __slots__ = (
+        'session', 'base_url', 'request_count', 'buckets',
+        'max_retries', 'max_workers', '_profile_cache',
+        'profile_cache_ttl', 'verbose', '_log', 'base_dir', 'folders', 'cache_ttl', 'cache_dir',
+        '_dirs_created', 'url_cache_path', '_url_cache',
+    )
+    
+    def __init__(self, max_workers: int = 6, cache_ttl: int = 600, verbose: bool = False):
         self.session = requests.Session()
         self.base_url = "https://www.instagram.com"
         self.request_count = 0
-        self.last_request_time = 0
-        self.rate_limit_delay = 2
-        self.downloaded_files = []
+        # One bucket per host, created on first use, so the page and API
+        # budgets don't serialise each other
+        self.buckets = {}
+        self.max_retries = 5
+        self.max_workers = max_workers
+        self._profile_cache = {}
+        self.profile_cache_ttl = 300
+        self.verbose = verbose
+        self._log = []
         
         # Set base directory
         self.base_dir = os.getcwd()
-        print(f"🐧 InstaOsint - Created by AvaBlix")
-        print(f"📁 Working directory: {self.base_dir}")
+        logger.info("🐧 InstaOsint - Created by AvaBlix")
+        logger.info("📁 Working directory: %s", self.base_dir)
         
         # Create folders
         self.folders = {
@@ -37,93 +187,227 @@ class InstagramOSINT:
             'data': os.path.join(self.base_dir, 'data')
         }
         
+        self._dirs_created = set()
         for folder_path in self.folders.values():
-            os.makedirs(folder_path, exist_ok=True)
+            self._ensure_dir(folder_path)
+        
+        # On-disk cache of profile pages, reused across runs for cache_ttl seconds
+        self.cache_ttl = cache_ttl
+        self.cache_dir = os.path.join(self.folders['data'], 'http_cache')
+        self._ensure_dir(self.cache_dir)
+        
+        # Keyed by file path, valued by the media key of the URL saved there, so
+        # overwriting a path with other media replaces its entry
+        self.url_cache_path = os.path.join(self.folders['data'], '_media_cache.json')
+        self._url_cache = self.load_url_cache()
         
         # Set headers
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-        })
-
-    def rate_limit(self):
-        current_time = time.time()
-        if current_time - self.last_request_time < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay)
-        self.last_request_time = time.time()
-
-    def make_request(self, url: str) -> Optional[requests.Response]:
-        self.rate_limit()
+        self.session.headers.update(_DEFAULT_HEADERS)
+        self.session.headers['User-Agent'] = random.choice(_USER_AGENTS)
+        
+        # Keep enough pooled keep-alive connections for concurrent downloads, and
+        # let urllib3 retry connection errors and 5xx for pages and media alike.
+        # Retry-After is ignored here: urllib3 would otherwise also retry 429s
+        # (uncapped) underneath make_request's own 429 loop
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def _ensure_dir(self, path: str):
+        # Folders created earlier this session cost no syscalls at all, and a
+        # folder whose parent is known to exist needs a single mkdir
+        if path in self._dirs_created:
+            return
+        if os.path.dirname(path) in self._dirs_created:
+            try:
+                os.mkdir(path)
+            except FileExistsError:
+                pass
+            except FileNotFoundError:
+                # Parent was removed since it was memoised, rebuild the chain
+                os.makedirs(path, exist_ok=True)
+        else:
+            os.makedirs(path, exist_ok=True)
+        self._dirs_created.add(path)
+
+    def log(self, message: str):
+        # Progress is logged live only in verbose mode, otherwise emitted as one record by flush_log
+        if self.verbose:
+            logger.info(message)
+        else:
+            self._log.append(message)
+
+    def flush_log(self):
+        if self._log:
+            logger.info('\n'.join(self._log))
+            self._log.clear()
+
+    def _bucket(self, host: str) -> TokenBucket:
+        bucket = self.buckets.get(host)
+        if bucket is None:
+            # setdefault is atomic, threads racing on a new host share one bucket
+            bucket = self.buckets.setdefault(host, TokenBucket(*_RATE_LIMIT))
+        return bucket
+
+    def make_request(self, url: str, stream: bool = False, headers: Optional[Dict] = None) -> Optional[requests.Response]:
+        # Media CDNs are not subject to Instagram's per-client throttling, only
+        # instagram.com hosts pay for a token and get the 429 handling
+        host = urlsplit(url).hostname or ''
+        if host.endswith(_CDN_HOSTS):
+            return self.make_cdn_request(url, stream)
+        
+        self._bucket(host).acquire()
+        for attempt in range(self.max_retries):
+            try:
+                response = self.session.get(url, timeout=10, stream=stream, headers=headers)
+            except requests.RequestException:
+                # Connection errors and 5xx were already retried by the adapter
+                return None
+            if response.status_code != 429:
+                return response
+            
+            # Instagram throttling needs far longer waits than the adapter's backoff
+            if attempt + 1 < self.max_retries:
+                time.sleep(_retry_after(response, min(60, 2 ** attempt) + random.random()))
+        return None
+
+    def make_cdn_request(self, url: str, stream: bool = False) -> Optional[requests.Response]:
+        # Not rate limited; concurrency is bounded by download_files instead
         try:
-            response = self.session.get(url, timeout=10)
-            return response
-        except:
+            return self.session.get(url, timeout=10, stream=stream)
+        except requests.RequestException:
             return None
 
-    def get_profile_data(self, username: str) -> Optional[Dict]:
-        url = f"{self.base_url}/{username}/"
-        response = self.make_request(url)
+    def clear_cache(self):
+        self._profile_cache.clear()
+        self._dirs_created.clear()
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file():
+                os.remove(entry.path)
+
+    def fetch_page(self, url: str, headers: Optional[Dict] = None) -> Optional[bytes]:
+        cache_path = os.path.join(self.cache_dir, hashlib.sha1(url.encode()).hexdigest())
+        try:
+            if time.time() - os.path.getmtime(cache_path) < self.cache_ttl:
+                with open(cache_path, 'rb') as f:
+                    return f.read()
+        except OSError:
+            pass
         
+        response = self.make_request(url, headers=headers)
         if not response or response.status_code != 200:
             return None
-            
-        # Find JSON data in page
-        patterns = [
-            r'window\._sharedData\s*=\s*({.+?});',
-            r'{"config":.*?}',
-        ]
         
-        for pattern in patterns:
-            match = re.search(pattern, response.text)
-            if match:
+        page = response.content
+        if self.cache_ttl > 0:
+            try:
+                self.replace_file(cache_path, page)
+            except OSError:
+                pass
+        return page
+
+    def _fetch_json(self, url: str, headers: Optional[Dict] = None):
+        page = self.fetch_page(url, headers)
+        if not page:
+            return None
+        try:
+            return json_loads(page)
+        except ValueError:
+            return None
+
+    def _fetch_profile_json(self, username: str) -> Optional[Dict]:
+        # web_profile_info is what Instagram's own web client calls and returns
+        # just the user node, a few KB against the full profile page
+        data = self._fetch_json(f"{_API_URL}/users/web_profile_info/?username={username}", _APP_HEADERS)
+        user = _dig(data, 'data', 'user')
+        if not isinstance(user, dict):
+            # The older web endpoint is still served to some clients
+            user = _dig(self._fetch_json(f"{self.base_url}/{username}/?__a=1&__d=dis"), 'graphql', 'user')
+        if not isinstance(user, dict):
+            return None
+        # Same shape as _sharedData so the extractors stay unchanged
+        return {'entry_data': {'ProfilePage': [{'graphql': {'user': user}}]}}
+
+    def get_profile_data(self, username: str) -> Optional[Dict]:
+        data = self._fetch_profile_json(username)
+        if data:
+            return data
+        
+        # Instagram disables the JSON endpoint for some logged-out clients,
+        # fall back to scraping the profile page
+        page = self.fetch_page(f"{self.base_url}/{username}/")
+        if not page:
+            return None
+            
+        # Work on the raw bytes, both JSON parsers accept them without a decode.
+        # Some page variants inline the object without the window._sharedData
+        # assignment, so fall back to locating it by its leading key
+        for marker in (_SHAREDDATA_MARKER, _CONFIG_MARKER):
+            shared_data = _slice_shared_data(page, marker)
+            if shared_data:
                 try:
-                    return json.loads(match.group(1))
-                except:
-                    continue
+                    return json_loads(shared_data)
+                except ValueError:
+                    pass
         return None
 
-    def extract_profile_info(self, username: str) -> Dict:
+    def get_user(self, username: str) -> Optional[Dict]:
+        # Only the user node is cached, the rest of the payload is dropped
+        cached = self._profile_cache.get(username)
+        if cached and time.monotonic() - cached[0] < self.profile_cache_ttl:
+            return cached[1]
+        
         data = self.get_profile_data(username)
         if not data:
+            return None
+        try:
+            user = data['entry_data']['ProfilePage'][0]['graphql']['user']
+        except (KeyError, IndexError, TypeError):
+            return None
+        self._profile_cache[username] = (time.monotonic(), user)
+        return user
+
+    def extract_profile_info(self, user: Optional[Dict]) -> Dict:
+        if not user:
             return {'error': 'Could not fetch profile data'}
         
         try:
-            user = data['entry_data']['ProfilePage'][0]['graphql']['user']
-            
-            return {
-                'username': user.get('username'),
-                'full_name': user.get('full_name'),
-                'biography': user.get('biography'),
-                'followers': user.get('edge_followed_by', {}).get('count'),
-                'following': user.get('edge_follow', {}).get('count'),
-                'posts_count': user.get('edge_owner_to_timeline_media', {}).get('count'),
-                'is_private': user.get('is_private'),
-                'is_verified': user.get('is_verified'),
-                'profile_pic_url': user.get('profile_pic_url_hd'),
-                'external_url': user.get('external_url'),
-                'is_business': user.get('is_business_account'),
-                'category': user.get('category_name'),
-            }
-        except:
+            get = user.get
+            profile = {key: get(field) for key, field in _PROFILE_FIELDS}
+            for key, edge in _COUNT_FIELDS:
+                profile[key] = _dig(user, edge, 'count', default=0)
+            return profile
+        except (AttributeError, TypeError):
             return {'error': 'Failed to parse profile data'}
 
-    def extract_posts(self, username: str, limit: int = 12) -> List[Dict]:
-        data = self.get_profile_data(username)
-        if not data:
+    def extract_posts(self, user: Optional[Dict], limit: int = 12) -> List[Dict]:
+        if not user:
             return []
         
         try:
-            user = data['entry_data']['ProfilePage'][0]['graphql']['user']
-            posts = user.get('edge_owner_to_timeline_media', {}).get('edges', [])
+            posts = _dig(user, 'edge_owner_to_timeline_media', 'edges') or ()
             
             post_data = []
             for post in posts[:limit]:
                 node = post.get('node', {})
                 
                 # Get caption
-                caption_edges = node.get('edge_media_to_caption', {}).get('edges', [])
-                caption = caption_edges[0].get('node', {}).get('text', '') if caption_edges else ''
+                caption = _dig(node, 'edge_media_to_caption', 'edges', 0, 'node', 'text', default='')
+                
+                # Hashtags and mentions in a single pass over the caption; most
+                # captions have neither, so skip the regex when it cannot match
+                hashtags, mentions = [], []
+                if '#' in caption or '@' in caption:
+                    for hashtag, mention in _TAG_RE.findall(caption):
+                        (hashtags if hashtag else mentions).append(hashtag or mention)
                 
                 post_info = {
                     'id': node.get('id'),
@@ -133,99 +417,201 @@ class InstagramOSINT:
                     'display_url': node.get('display_url'),
                     'video_url': node.get('video_url'),
                     'caption': caption,
-                    'comments': node.get('edge_media_to_comment', {}).get('count', 0),
-                    'likes': node.get('edge_liked_by', {}).get('count', 0),
+                    'comments': _dig(node, 'edge_media_to_comment', 'count', default=0),
+                    'likes': _dig(node, 'edge_liked_by', 'count', default=0),
                     'dimensions': node.get('dimensions', {}),
-                    'hashtags': re.findall(r'#\w+', caption),
-                    'mentions': re.findall(r'@\w+', caption),
+                    'hashtags': hashtags,
+                    'mentions': mentions,
                     'location': node.get('location')
                 }
                 post_data.append(post_info)
             
             return post_data
-        except:
+        except (AttributeError, KeyError, IndexError, TypeError):
             return []
 
-    def download_file(self, url: str, filepath: str) -> bool:
+    def _media_key(self, url: str) -> str:
+        # CDN query strings carry expiring signatures, the path identifies the media
+        return hashlib.blake2b(urlsplit(url).path.encode(), digest_size=8).hexdigest()
+
+    def load_url_cache(self) -> Dict[str, str]:
         try:
-            response = self.make_request(url)
-            if response and response.status_code == 200:
-                with open(filepath, 'wb') as f:
-                    f.write(response.content)
-                return True
-        except:
-            pass
-        return False
+            with open(self.url_cache_path, 'rb') as f:
+                return json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
+
+    def save_url_cache(self):
+        self.replace_file(self.url_cache_path, json_dumps(self._url_cache))
 
-    def generate_report(self, username: str) -> str:
-        print(f"🔍 Generating report for @{username}...")
+    def extract_emails(self, profile: Dict) -> List[str]:
+        # Works on an already fetched profile, never triggers a request; matches
+        # stream straight into the dedup dict without an intermediate list
+        return list(dict.fromkeys(m.group() for m in _EMAIL_RE.finditer(profile.get('biography') or '')))
+
+    def download_file(self, url: str, filepath: str) -> Optional[int]:
+        # Returns the number of bytes written, or None on failure
+        key = self._media_key(url)
+        if self._url_cache.get(filepath) == key:
+            # Same media already saved at this path by an earlier run
+            try:
+                return os.path.getsize(filepath)
+            except OSError:
+                pass
         
-        profile = self.extract_profile_info(username)
+        opened = False
+        try:
+            response = self.make_request(url, stream=True)
+            if response is None:
+                return None
+            with response:
+                if response.status_code == 200:
+                    # Stream to disk so videos never sit fully in memory
+                    response.raw.decode_content = True
+                    with open(filepath, 'wb', buffering=1 << 20) as f:
+                        opened = True
+                        shutil.copyfileobj(response.raw, f, 64 * 1024)
+                        written = f.tell()
+                    self._url_cache[filepath] = key
+                    return written
+        except (requests.RequestException, Urllib3Error, OSError):
+            # Reading response.raw raises urllib3 errors, not requests ones;
+            # either way, don't leave a truncated file behind
+            if opened:
+                self._url_cache.pop(filepath, None)
+                try:
+                    os.remove(filepath)
+                except OSError:
+                    pass
+        return None
+
+    def download_files(self, jobs: List[Tuple[str, str]]) -> List[Optional[int]]:
+        if not jobs:
+            return []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(lambda job: self.download_file(*job), jobs))
+
+    def replace_file(self, filepath: str, data: bytes):
+        # Write aside and rename so a concurrent or interrupted run never
+        # leaves a half-written file where a complete one is expected
+        tmp_path = f"{filepath}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, filepath)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def save_bytes(self, filepath: str, data: bytes):
+        with open(filepath, 'wb', buffering=1 << 20) as f:
+            f.write(data)
+
+    def save_text(self, filepath: str, content: str):
+        # Encode once and write the bytes through a large buffer, skipping the text layer
+        self.save_bytes(filepath, content.encode('utf-8'))
+
+    def save_report(self, username: str, report: str, timestamp: Optional[str] = None) -> str:
+        # Pass the stamp generate_report returned so the filename matches the report header
+        timestamp = timestamp or time.strftime("%Y%m%d_%H%M%S")
+        report_file = os.path.join(self.folders['reports'], f"{username}_report_{timestamp}.txt")
+        self.save_text(report_file, report)
+        return report_file
+
+    def generate_report(self, username: str) -> Tuple[str, str]:
+        # Returns (report, file stamp); the stamp travels with the report rather
+        # than living on self, since reports for several targets run concurrently
+        logger.info("🔍 Generating report for @%s...", username)
+        # One clock read per report, both formats derive from it
+        generated_at = time.localtime()
+        timestamp = time.strftime("%Y%m%d_%H%M%S", generated_at)
+        
+        user = self.get_user(username)
+        profile = self.extract_profile_info(user)
         if 'error' in profile:
-            return f"❌ Error: {profile['error']}"
+            return f"❌ Error: {profile['error']}", timestamp
         
-        posts = self.extract_posts(username, 6)
+        posts = self.extract_posts(user, 6)
         
-        report = []
-        report.append("=" * 60)
-        report.append(f"INSTAOSINT REPORT - @{username}")
-        report.append(f"Created by AvaBlix")
-        report.append(f"Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append("=" * 60)
+        report = io.StringIO()
+        w = report.write
+        w("=" * 60 + "\n")
+        w(f"INSTAOSINT REPORT - @{username}\n")
+        w(f"Created by AvaBlix\n")
+        w(f"Generated: {time.strftime('%Y-%m-%d %H:%M:%S', generated_at)}\n")
+        w("=" * 60 + "\n")
         
         # Profile Info
-        report.append("\n👤 PROFILE INFORMATION")
-        report.append(f"Username: {profile.get('username')}")
-        report.append(f"Full Name: {profile.get('full_name')}")
-        report.append(f"Bio: {profile.get('biography', 'No bio')}")
-        report.append(f"Followers: {profile.get('followers', 0):,}")
-        report.append(f"Following: {profile.get('following', 0):,}")
-        report.append(f"Posts: {profile.get('posts_count', 0):,}")
-        report.append(f"Private: {'Yes' if profile.get('is_private') else 'No'}")
-        report.append(f"Verified: {'Yes' if profile.get('is_verified') else 'No'}")
-        report.append(f"Business: {'Yes' if profile.get('is_business') else 'No'}")
-        report.append(f"Category: {profile.get('category', 'N/A')}")
-        report.append(f"External URL: {profile.get('external_url', 'None')}")
+        w(f"""
+👤 PROFILE INFORMATION
+Username: {profile.get('username')}
+Full Name: {profile.get('full_name')}
+Bio: {profile.get('biography', 'No bio')}
+Followers: {profile.get('followers', 0):,}
+Following: {profile.get('following', 0):,}
+Posts: {profile.get('posts_count', 0):,}
+Private: {'Yes' if profile.get('is_private') else 'No'}
+Verified: {'Yes' if profile.get('is_verified') else 'No'}
+Business: {'Yes' if profile.get('is_business') else 'No'}
+Category: {profile.get('category', 'N/A')}
+External URL: {profile.get('external_url', 'None')}
+""")
         
         # Email extraction
-        emails = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', profile.get('biography', ''))
-        report.append(f"\n📧 EMAILS FOUND: {len(emails)}")
+        emails = self.extract_emails(profile)
+        w(f"\n📧 EMAILS FOUND: {len(emails)}\n")
         for email in emails:
-            report.append(f"  {email}")
+            w(f"  {email}\n")
         
         # Posts analysis
-        report.append(f"\n📷 RECENT POSTS ANALYSIS")
-        report.append(f"Posts analyzed: {len(posts)}")
+        w(f"\n📷 RECENT POSTS ANALYSIS\n")
+        w(f"Posts analyzed: {len(posts)}\n")
         if posts:
-            total_likes = sum(p.get('likes', 0) for p in posts)
-            total_comments = sum(p.get('comments', 0) for p in posts)
-            report.append(f"Total likes: {total_likes:,}")
-            report.append(f"Total comments: {total_comments:,}")
-            report.append(f"Average likes: {total_likes // len(posts):,}")
-        
-        # Hashtags and mentions
-        all_hashtags = []
-        all_mentions = []
-        for post in posts:
-            all_hashtags.extend(post.get('hashtags', []))
-            all_mentions.extend(post.get('mentions', []))
-        
-        report.append(f"\n🏷️ TOP HASHTAGS ({len(set(all_hashtags))} unique)")
-        for tag in list(set(all_hashtags))[:10]:
-            report.append(f"  {tag}")
-        
-        report.append(f"\n👥 MENTIONS ({len(set(all_mentions))} unique)")
-        for mention in list(set(all_mentions))[:10]:
-            report.append(f"  {mention}")
-        
-        return "\n".join(report)
+            total_likes = total_comments = 0
+            for p in posts:
+                total_likes += p.get('likes') or 0
+                total_comments += p.get('comments') or 0
+            w(f"Total likes: {total_likes:,}\n")
+            w(f"Total comments: {total_comments:,}\n")
+            w(f"Average likes: {total_likes // len(posts):,}\n")
+        
+        # Hashtags and mentions, ranked by frequency
+        hashtag_counts = Counter(chain.from_iterable(p.get('hashtags', ()) for p in posts))
+        mention_counts = Counter(chain.from_iterable(p.get('mentions', ()) for p in posts))
+        
+        w(f"\n🏷️ TOP HASHTAGS ({len(hashtag_counts)} unique)\n")
+        for tag, count in hashtag_counts.most_common(10):
+            w(f"  {tag} ({count})\n")
+        
+        w(f"\n👥 MENTIONS ({len(mention_counts)} unique)\n")
+        for mention, count in mention_counts.most_common(10):
+            w(f"  {mention} ({count})\n")
+        
+        return report.getvalue().rstrip("\n"), timestamp
+
+    def generate_reports(self, usernames: List[str]) -> Iterator[Tuple[str, str, str]]:
+        # Profile fetches are network bound, overlap them across targets; the
+        # per-host token buckets still cap the rate against each Instagram host.
+        # (username, report, stamp) is yielded as each report finishes so callers
+        # can act on it early
+        usernames = list(dict.fromkeys(usernames))
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(usernames) or 1)) as executor:
+            futures = {executor.submit(self.generate_report, username): username for username in usernames}
+            for future in as_completed(futures):
+                yield (futures[future], *future.result())
 
     def download_all_media(self, username: str) -> List[str]:
-        print(f"📥 Starting download for @{username}...")
+        self.log(f"📥 Starting download for @{username}...")
+        captured_at = time.strftime('%Y-%m-%d %H:%M:%S')
         
-        profile = self.extract_profile_info(username)
+        user = self.get_user(username)
+        profile = self.extract_profile_info(user)
         if 'error' in profile:
-            print(f"❌ {profile['error']}")
+            self.log(f"❌ {profile['error']}")
+            self.flush_log()
             return []
         
         # Create main folder structure
@@ -237,27 +623,51 @@ class InstagramOSINT:
             'highlights': os.path.join(main_folder, 'highlights')
         }
         
+        if main_folder in self._dirs_created and not os.path.isdir(main_folder):
+            # Removed since an earlier download this session, forget it and its
+            # subfolders so _ensure_dir recreates the whole tree
+            self._dirs_created.difference_update([main_folder, *folders.values()])
+        self._ensure_dir(main_folder)
         for folder in folders.values():
-            os.makedirs(folder, exist_ok=True)
+            self._ensure_dir(folder)
+        
+        profile_pic_path = os.path.join(folders['general'], 'profile_picture.jpg')
+        profile_info_path = os.path.join(folders['general'], 'profile_info.txt')
+        posts_dir = folders['posts']
+        posts_info_path = os.path.join(posts_dir, 'posts_analysis.txt')
+        stories_info_path = os.path.join(folders['stories'], 'stories_info.txt')
+        highlights_info_path = os.path.join(folders['highlights'], 'highlights_info.txt')
         
         downloaded_files = []
+        posts = self.extract_posts(user, 8)
         
-        # 1. Download profile picture
-        print("🖼️ Downloading profile picture...")
+        # Profile picture and post media go out as one concurrent batch
+        media_jobs = {}
         profile_pic_url = profile.get('profile_pic_url')
         if profile_pic_url:
-            profile_pic_path = os.path.join(folders['general'], 'profile_picture.jpg')
-            if self.download_file(profile_pic_url, profile_pic_path):
-                downloaded_files.append(profile_pic_path)
-                print("✅ Profile picture downloaded")
+            media_jobs['profile_picture'] = (profile_pic_url, profile_pic_path)
+        for post_num, post in enumerate(posts, 1):
+            media_url = post.get('display_url')
+            if media_url:
+                ext = 'mp4' if post.get('is_video') else 'jpg'
+                media_path = f"{posts_dir}{os.sep}post_{post_num:02d}.{ext}"
+                media_jobs[post_num] = (media_url, media_path)
+        
+        self.log(f"⬇️ Downloading {len(media_jobs)} media files...")
+        results = dict(zip(media_jobs, self.download_files(list(media_jobs.values()))))
+        
+        # 1. Profile picture
+        if results.get('profile_picture') is not None:
+            downloaded_files.append(profile_pic_path)
+            self.log("✅ Profile picture downloaded")
         
         # 2. Save profile info
-        print("📄 Saving profile information...")
+        self.log("📄 Saving profile information...")
         profile_info = [
             "=" * 50,
             f"PROFILE INFO - @{username}",
             f"Created by AvaBlix",
-            f"Captured: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            f"Captured: {captured_at}",
             "=" * 50,
             f"Username: {profile.get('username')}",
             f"Full Name: {profile.get('full_name')}",
@@ -272,67 +682,55 @@ class InstagramOSINT:
             f"External URL: {profile.get('external_url', 'None')}",
         ]
         
-        profile_info_path = os.path.join(folders['general'], 'profile_info.txt')
-        with open(profile_info_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(profile_info))
+        self.save_text(profile_info_path, '\n'.join(profile_info))
         downloaded_files.append(profile_info_path)
         
-        # 3. Download posts
-        print("📷 Downloading posts...")
-        posts = self.extract_posts(username, 8)
-        
+        # 3. Posts
         if posts:
-            posts_info = []
-            posts_info.append("=" * 50)
-            posts_info.append(f"POSTS ANALYSIS - @{username}")
-            posts_info.append(f"Total Posts: {len(posts)}")
-            posts_info.append("=" * 50)
+            posts_buf = io.StringIO()
+            w = posts_buf.write
+            w("=" * 50 + "\n")
+            w(f"POSTS ANALYSIS - @{username}\n")
+            w(f"Total Posts: {len(posts)}\n")
+            w("=" * 50 + "\n")
             
-            for i, post in enumerate(posts):
-                post_num = i + 1
-                posts_info.append(f"\n{'='*30}")
-                posts_info.append(f"POST {post_num:02d}")
-                posts_info.append(f"{'='*30}")
+            for post_num, post in enumerate(posts, 1):
+                w(f"\n{'='*30}\n")
+                w(f"POST {post_num:02d}\n")
+                w(f"{'='*30}\n")
                 
-                # Download media
-                media_url = post.get('display_url')
-                if media_url:
-                    ext = 'mp4' if post.get('is_video') else 'jpg'
-                    media_path = os.path.join(folders['posts'], f'post_{post_num:02d}.{ext}')
+                # Media info
+                file_size = results.get(post_num)
+                if file_size is not None:
+                    media_path = media_jobs[post_num][1]
+                    downloaded_files.append(media_path)
                     
-                    if self.download_file(media_url, media_path):
-                        downloaded_files.append(media_path)
-                        file_size = os.path.getsize(media_path)
-                        
-                        posts_info.append(f"File: post_{post_num:02d}.{ext}")
-                        posts_info.append(f"Size: {file_size / (1024*1024):.2f} MB")
-                        posts_info.append(f"Type: {'Video' if post.get('is_video') else 'Image'}")
-                        posts_info.append(f"Dimensions: {post.get('dimensions', {}).get('height', 'N/A')}x{post.get('dimensions', {}).get('width', 'N/A')}")
+                    w(f"File: {os.path.basename(media_path)}\n")
+                    w(f"Size: {file_size / (1024*1024):.2f} MB\n")
+                    w(f"Type: {'Video' if post.get('is_video') else 'Image'}\n")
+                    w(f"Dimensions: {_dig(post, 'dimensions', 'height', default='N/A')}x{_dig(post, 'dimensions', 'width', default='N/A')}\n")
                 
                 # Post metadata
-                posts_info.append(f"ID: {post.get('id', 'N/A')}")
-                posts_info.append(f"Shortcode: {post.get('shortcode', 'N/A')}")
-                posts_info.append(f"Timestamp: {datetime.datetime.fromtimestamp(post.get('timestamp', 0)).strftime('%Y-%m-%d %H:%M:%S') if post.get('timestamp') else 'N/A'}")
-                posts_info.append(f"Likes: {post.get('likes', 0):,}")
-                posts_info.append(f"Comments: {post.get('comments', 0):,}")
-                posts_info.append(f"Caption: {post.get('caption', 'No caption')}")
-                posts_info.append(f"Hashtags: {', '.join(post.get('hashtags', []))}")
-                posts_info.append(f"Mentions: {', '.join(post.get('mentions', []))}")
+                w(f"ID: {post.get('id', 'N/A')}\n")
+                w(f"Shortcode: {post.get('shortcode', 'N/A')}\n")
+                timestamp = post.get('timestamp')
+                w(f"Timestamp: {datetime.datetime.fromtimestamp(timestamp).isoformat(sep=' ', timespec='seconds') if timestamp else 'N/A'}\n")
+                w(f"Likes: {post.get('likes', 0):,}\n")
+                w(f"Comments: {post.get('comments', 0):,}\n")
+                w(f"Caption: {post.get('caption', 'No caption')}\n")
+                w(f"Hashtags: {', '.join(post.get('hashtags', []))}\n")
+                w(f"Mentions: {', '.join(post.get('mentions', []))}\n")
                 
                 if post.get('location'):
-                    posts_info.append(f"Location: {post.get('location', {}).get('name', 'N/A')}")
-                
-                time.sleep(0.5)
+                    w(f"Location: {_dig(post, 'location', 'name', default='N/A')}\n")
             
             # Save posts analysis
-            posts_info_path = os.path.join(folders['posts'], 'posts_analysis.txt')
-            with open(posts_info_path, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(posts_info))
+            self.save_text(posts_info_path, posts_buf.getvalue())
             downloaded_files.append(posts_info_path)
-            print(f"✅ Downloaded {len(posts)} posts")
+            self.log(f"✅ Downloaded {len(posts)} posts")
         
         # 4. Create stories info (stories require authentication)
-        print("🎬 Creating stories info...")
+        self.log("🎬 Creating stories info...")
         stories_info = [
             "=" * 50,
             "STORIES INFORMATION",
@@ -341,13 +739,11 @@ class InstagramOSINT:
             "=" * 50
         ]
         
-        stories_info_path = os.path.join(folders['stories'], 'stories_info.txt')
-        with open(stories_info_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(stories_info))
+        self.save_text(stories_info_path, '\n'.join(stories_info))
         downloaded_files.append(stories_info_path)
         
         # 5. Create highlights info
-        print("🌟 Creating highlights info...")
+        self.log("🌟 Creating highlights info...")
         highlights_info = [
             "=" * 50,
             "HIGHLIGHTS INFORMATION", 
@@ -356,61 +752,109 @@ class InstagramOSINT:
             "=" * 50
         ]
         
-        highlights_info_path = os.path.join(folders['highlights'], 'highlights_info.txt')
-        with open(highlights_info_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(highlights_info))
+        self.save_text(highlights_info_path, '\n'.join(highlights_info))
         downloaded_files.append(highlights_info_path)
         
-        print(f"🎉 Download complete!")
-        print(f"📁 Files saved in: {main_folder}")
-        print(f"📊 Total files: {len(downloaded_files)}")
-        print("👩‍💻 Created by AvaBlix")
+        self.log(f"🎉 Download complete!")
+        self.log(f"📁 Files saved in: {main_folder}")
+        self.log(f"📊 Total files: {len(downloaded_files)}")
+        self.log("👩‍💻 Created by AvaBlix")
+        self.flush_log()
         
+        self.save_url_cache()
         return downloaded_files
 
+class OsintShell(cmd.Cmd):
+    """Interactive prompt bound to a single target username."""
+    
+    intro = "Commands: report, download, refresh, exit"
+    prompt = "\n[osint]~$ "
+    
+    def __init__(self, tool: InstagramOSINT, username: str):
+        super().__init__()
+        self.tool = tool
+        self.username = username
+    
+    def precmd(self, line: str) -> str:
+        # cmd signals end of input with the literal 'EOF', which must reach do_EOF
+        return line if line == 'EOF' else line.strip().lower()
+    
+    def do_report(self, _):
+        report, _ = self.tool.generate_report(self.username)
+        print(report)
+    
+    def do_download(self, _):
+        self.tool.download_all_media(self.username)
+    
+    def do_refresh(self, _):
+        self.tool.clear_cache()
+        print("🔄 Cached profile data cleared")
+    
+    def do_exit(self, _):
+        return True
+    
+    do_quit = do_EOF = do_exit
+    
+    def emptyline(self):
+        # Cmd would repeat the last command, which re-runs downloads
+        print(self.intro)
+    
+    def default(self, line: str):
+        print(self.intro)
+
 def main():
+    # CLI-only, kept out of the import path for library use
+    import argparse
+    
     parser = argparse.ArgumentParser(description='Instagram OSINT Tool - Created by AvaBlix')
-    parser.add_argument('username', help='Instagram username to analyze')
+    parser.add_argument('usernames', nargs='*', metavar='username', help='Instagram username(s) to analyze')
+    parser.add_argument('--targets', metavar='FILE', help='File with one username per line, reported concurrently')
     parser.add_argument('--report', action='store_true', help='Generate OSINT report')
     parser.add_argument('--download', action='store_true', help='Download all media')
+    parser.add_argument('--workers', type=int, default=6, help='Concurrent media downloads (default: 6)')
+    parser.add_argument('--no-cache', action='store_true', help='Always fetch fresh profile pages')
+    parser.add_argument('--verbose', action='store_true', help='Print download progress as it happens')
     
     args = parser.parse_args()
     
-    tool = InstagramOSINT()
+    # Status goes to stderr so reports printed to stdout can be redirected cleanly
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     
-    if args.report:
-        report = tool.generate_report(args.username)
-        print(report)
-        
-        # Save report to file
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        report_file = os.path.join(tool.folders['reports'], f"{args.username}_report_{timestamp}.txt")
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write(report)
-        print(f"\n💾 Report saved to: {report_file}")
-        
+    usernames = [username.lstrip('@') for username in args.usernames]
+    if args.targets:
+        try:
+            with open(args.targets, encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith('#'):
+                        usernames.append(line.lstrip('@'))
+        except OSError as e:
+            parser.error(f"cannot read targets file: {e}")
+    # Drop names that were only '@' and repeats, once for every mode below
+    usernames = list(dict.fromkeys(filter(None, usernames)))
+    if not usernames:
+        parser.error("a username or --targets file is required")
+    
+    tool = InstagramOSINT(max_workers=max(1, args.workers), cache_ttl=0 if args.no_cache else 600, verbose=args.verbose)
+    
+    if args.report or (len(usernames) > 1 and not args.download):
+        for username, report, timestamp in tool.generate_reports(usernames):
+            print(report)
+            
+            # Save report to file
+            report_file = tool.save_report(username, report, timestamp)
+            print(f"\n💾 Report saved to: {report_file}")
+            
     elif args.download:
-        tool.download_all_media(args.username)
+        for username in usernames:
+            tool.download_all_media(username)
     else:
         # Interactive mode
-        print(f"\n🔍 Analyzing: @{args.username}")
-        print("Commands: report, download, exit")
-        
-        while True:
-            try:
-                cmd = input("\n[osint]~$ ").strip().lower()
-                
-                if cmd == 'report':
-                    report = tool.generate_report(args.username)
-                    print(report)
-                elif cmd == 'download':
-                    tool.download_all_media(args.username)
-                elif cmd in ['exit', 'quit']:
-                    break
-                else:
-                    print("Commands: report, download, exit")
-            except KeyboardInterrupt:
-                break
+        print(f"\n🔍 Analyzing: @{usernames[0]}")
+        try:
+            OsintShell(tool, usernames[0]).cmdloop()
+        except KeyboardInterrupt:
+            pass
 
 if __name__ == "__main__":
     main()